@@ -1,3 +1,5 @@
+import sys
+
 from xsdata.utils.testing import AttrTypeFactory, FactoryTestCase
 
 
@@ -17,3 +19,8 @@ class AttrTypeTests(FactoryTestCase):
 
         attr_type.circular = False
         self.assertTrue(attr_type.is_dependency(False))
+
+    def test_post_init_interns_qname(self):
+        qname = "".join(["{xsdata}", "foo"])
+        attr_type = AttrTypeFactory.create(qname=qname)
+        self.assertIs(sys.intern(qname), attr_type.qname)
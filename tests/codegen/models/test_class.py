@@ -89,6 +89,21 @@ class ClassTests(FactoryTestCase):
         self.assertIn("circular", list(obj.dependencies(allow_circular=True)))
         self.assertIn("{xsdata}circular", list(obj.dependencies(allow_circular=True)))
 
+    def test_types_with_parents(self):
+        ext = ExtensionFactory.reference("ext")
+        attr = AttrFactory.reference("attr")
+        first_inner = ClassFactory.create(attrs=[AttrFactory.reference("first")])
+        second_inner = ClassFactory.create(attrs=[AttrFactory.reference("second")])
+        first_inner.inner.append(
+            ClassFactory.create(attrs=[AttrFactory.reference("nested")])
+        )
+        obj = ClassFactory.create(
+            extensions=[ext], attrs=[attr], inner=[first_inner, second_inner]
+        )
+
+        actual = [tp.qname for _, tp in obj.types_with_parents()]
+        self.assertEqual(["ext", "attr", "first", "nested", "second"], actual)
+
     def test_property_has_suffix_attr(self):
         obj = ClassFactory.create()
 
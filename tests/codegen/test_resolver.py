@@ -1,5 +1,7 @@
 from unittest import mock
 
+from toposort import CircularDependencyError
+
 from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.models import Class
 from xsdata.codegen.resolver import DependenciesResolver
@@ -232,3 +234,15 @@ class DependenciesResolverTest(FactoryTestCase):
             "{xsdata}class_B",
         ]
         self.assertEqual(expected, list(map(str, actual)))
+
+    @mock.patch.object(Class, "dependencies")
+    def test_create_class_list_with_circular_dependencies(self, mock_dependencies):
+        classes = ClassFactory.list(3)
+        mock_dependencies.side_effect = [
+            {classes[1].qname},
+            {classes[2].qname},
+            {classes[0].qname, "a"},
+        ]
+
+        with self.assertRaises(CircularDependencyError):
+            self.resolver.create_class_list(classes)
@@ -1,8 +1,11 @@
+import re
 from collections import namedtuple
 from unittest import mock
 
 from tests.fixtures.datatypes import Telephone
+from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.models import Restrictions
+from xsdata.formats.converter import ConverterFactory
 from xsdata.formats.dataclass.filters import Filters
 from xsdata.models.config import (
     DocstringStyle,
@@ -36,8 +39,8 @@ type_duration = AttrTypeFactory.native(DataType.DURATION)
 class FiltersTests(FactoryTestCase):
     def setUp(self) -> None:
         super().setUp()
-        config = GeneratorConfig()
-        self.filters = Filters(config)
+        self.config = GeneratorConfig()
+        self.filters = Filters(self.config)
 
         obj = ClassFactory.create(qname="a")
         obj_nested = ClassFactory.create(qname="b")
@@ -57,8 +60,16 @@ class FiltersTests(FactoryTestCase):
         self.obj_nested_nested = obj_nested_nested
         self.obj_nested_nested_nested = obj_nested_nested_nested
 
+    def configure(self, **kwargs):
+        output = self.config.output
+        for key, value in kwargs.items():
+            target = output.format if key == "frozen" else output
+            setattr(target, key, value)
+
+        self.filters = Filters(self.config)
+
     def test_class_name(self):
-        self.filters.substitutions[ObjectType.CLASS]["Abc"] = "Cba"
+        self.filters.substitutions[ObjectType.CLASS].append((re.compile("Abc"), "Cba"))
 
         self.assertEqual("XsString", self.filters.class_name("xs:string"))
         self.assertEqual("FooBarBam", self.filters.class_name("foo:bar_bam"))
@@ -66,6 +77,12 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual("TypeType", self.filters.class_name(".*"))
         self.assertEqual("Cbad", self.filters.class_name("abcd"))
 
+    @mock.patch.object(Filters, "safe_name", return_value="Foo")
+    def test_class_name_is_cached(self, mock_safe_name):
+        self.assertEqual("Foo", self.filters.class_name("foo"))
+        self.assertEqual("Foo", self.filters.class_name("foo"))
+        mock_safe_name.assert_called_once()
+
     def test_class_bases(self):
         etp = ExtensionType.CLASS
         self.filters.extensions[etp] = [
@@ -166,8 +183,29 @@ class FiltersTests(FactoryTestCase):
         expected = self.filters.class_annotations(target, "FooBar")
         self.assertEqual(["@c", "@b", "@d"], expected)
 
+    def test_class_extensions(self):
+        etp = ExtensionType.CLASS
+        self.assertEqual([], self.filters.class_extensions(etp, "FooBar"))
+
+        ext = GeneratorExtension(type=etp, class_name="Foo.*", import_string="a.b")
+        self.filters.extensions[etp] = [ext]
+
+        actual = self.filters.class_extensions(etp, "FooBar")
+        self.assertEqual([ext], actual)
+        self.assertIs(actual, self.filters.class_extensions(etp, "FooBar"))
+        self.assertEqual([], self.filters.class_extensions(etp, "BarFoo"))
+
+    def test_safe_name_with_invalid_prefix(self):
+        self.filters.field_safe_prefix = "_"
+        with self.assertRaises(CodegenError):
+            self.filters.field_name("class", "A")
+
+        self.filters.class_safe_prefix = ""
+        with self.assertRaises(CodegenError):
+            self.filters.class_name("")
+
     def test_field_name(self):
-        self.filters.substitutions[ObjectType.FIELD]["abc"] = "cba"
+        self.filters.substitutions[ObjectType.FIELD].append((re.compile("abc"), "cba"))
 
         self.assertEqual("value", self.filters.field_name("", "cls"))
         self.assertEqual("foo", self.filters.field_name("foo", "cls"))
@@ -182,8 +220,15 @@ class FiltersTests(FactoryTestCase):
         self.filters.field_case = NameCase.ORIGINAL
         self.assertEqual("foo", self.filters.field_name("@foo", "cls"))
 
+    @mock.patch.object(Filters, "safe_name", return_value="foo")
+    def test_field_name_is_cached_per_class_name(self, mock_safe_name):
+        self.assertEqual("foo", self.filters.field_name("foo", "a"))
+        self.assertEqual("foo", self.filters.field_name("foo", "a"))
+        self.assertEqual("foo", self.filters.field_name("foo", "b"))
+        self.assertEqual(2, mock_safe_name.call_count)
+
     def test_constant_name(self):
-        self.filters.substitutions[ObjectType.FIELD]["ABC"] = "CBA"
+        self.filters.substitutions[ObjectType.FIELD].append((re.compile("ABC"), "CBA"))
 
         self.assertEqual("VALUE", self.filters.constant_name("", "cls"))
         self.assertEqual("FOO", self.filters.constant_name("foo", "cls"))
@@ -196,8 +241,8 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual("CBAD", self.filters.constant_name("ABCD", "cls"))
 
     def test_module_name(self):
-        self.filters.substitutions[ObjectType.MODULE].update(
-            {"http://pypi.org/project/xsdata/": "xsdata"}
+        self.filters.substitutions[ObjectType.MODULE].append(
+            (re.compile("http://pypi.org/project/xsdata/"), "xsdata")
         )
 
         self.assertEqual("foo_bar", self.filters.module_name("fooBar"))
@@ -211,8 +256,9 @@ class FiltersTests(FactoryTestCase):
         )
 
     def test_package_name(self):
-        self.filters.substitutions[ObjectType.PACKAGE]["bam"] = "boom"
-        self.filters.substitutions[ObjectType.PACKAGE]["abc"] = "a.b.c"
+        self.filters.substitutions[ObjectType.PACKAGE].extend(
+            [(re.compile("bam"), "boom"), (re.compile("abc"), "a.b.c")]
+        )
 
         self.assertEqual(
             "foo.bar_bar.pkg_1", self.filters.package_name("Foo.BAR_bar.1")
@@ -239,11 +285,27 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual("Alias", self.filters.constant_value(attr))
 
     def test_apply_substitutions_with_regexes(self):
-        self.filters.substitutions[ObjectType.CLASS]["(.*)Class"] = "\\1Type"
+        self.filters.substitutions[ObjectType.CLASS].append(
+            (re.compile("(.*)Class"), "\\1Type")
+        )
 
         actual = self.filters.apply_substitutions("FooClass", ObjectType.CLASS)
         self.assertEqual("FooType", actual)
 
+    def test_apply_substitutions_is_cached(self):
+        actual = self.filters.apply_substitutions("Foo", ObjectType.CLASS)
+        self.assertEqual("Foo", actual)
+        self.assertEqual({}, self.filters.substituted_names)
+        self.assertNotIn(ObjectType.CLASS, self.filters.substitutions)
+
+        self.filters.substitutions[ObjectType.CLASS].append((re.compile("Foo"), "Bar"))
+        actual = self.filters.apply_substitutions("Foo", ObjectType.CLASS)
+        self.assertEqual("Bar", actual)
+
+        self.filters.substituted_names[(ObjectType.CLASS, "Foo")] = "Thug"
+        actual = self.filters.apply_substitutions("Foo", ObjectType.CLASS)
+        self.assertEqual("Thug", actual)
+
     @mock.patch.object(Filters, "field_default_value")
     def test_field_definition(self, mock_field_default_value):
         mock_field_default_value.side_effect = [1, False]
@@ -326,9 +388,11 @@ class FiltersTests(FactoryTestCase):
         attr.restrictions.min_occurs = 0
         self.assertEqual(None, self.filters.field_default_value(attr))
 
-    def test_field_default_value_with_type_str(self):
+    @mock.patch.object(ConverterFactory, "deserialize")
+    def test_field_default_value_with_type_str(self, mock_deserialize):
         attr = AttrFactory.create(types=[type_str], default="foo")
         self.assertEqual("'foo'", self.filters.field_default_value(attr))
+        mock_deserialize.assert_not_called()
 
     def test_field_default_value_with_type_tokens(self):
         attr = AttrFactory.create(types=[type_int, type_str], default="1  \n bar")
@@ -530,6 +594,13 @@ class FiltersTests(FactoryTestCase):
 
         self.assertEqual(expected, actual["choices"])
 
+    def test_filter_metadata(self):
+        data = {"a": None, "b": False, "c": 0, "d": "", "e": True}
+        actual = self.filters.filter_metadata(data)
+
+        self.assertIs(data, actual)
+        self.assertEqual({"c": 0, "d": "", "e": True}, actual)
+
     def test_field_choices(self):
         attr = AttrFactory.create(
             choices=[
@@ -582,7 +653,7 @@ class FiltersTests(FactoryTestCase):
         attr.restrictions.nillable = True
         self.assertEqual("Optional[FooBar]", self.filters.field_type(self.obj, attr))
 
-        self.filters.union_type = True
+        self.configure(union_type=True)
         self.assertEqual("None | FooBar", self.filters.field_type(self.obj, attr))
 
     def test_field_type_with_optional_value(self):
@@ -596,7 +667,7 @@ class FiltersTests(FactoryTestCase):
         attr.restrictions.min_occurs = 0
         self.assertEqual("Optional[FooBar]", self.filters.field_type(self.obj, attr))
 
-        self.filters.union_type = True
+        self.configure(union_type=True)
         self.assertEqual("None | FooBar", self.filters.field_type(self.obj, attr))
 
     def test_field_type_with_circular_reference(self):
@@ -609,6 +680,23 @@ class FiltersTests(FactoryTestCase):
             self.filters.field_type(self.obj_nested_nested_nested, attr),
         )
 
+    def test_field_type_names_are_cached(self):
+        attr = AttrFactory.create(
+            types=AttrTypeFactory.list(1, qname="c", circular=True)
+        )
+        self.filters.field_type(self.obj, attr)
+        self.filters.choice_type(self.obj, attr)
+
+        expected = {
+            ("c", None, False, True, False): '"C"',
+            ("c", None, False, True, True): '"C"',
+        }
+        self.assertEqual(expected, self.filters.field_type_names)
+
+        attr.types[0].forward = True
+        self.filters.field_type(self.obj_nested_nested, attr)
+        self.assertEqual(expected, self.filters.field_type_names)
+
     def test_field_type_with_forward_reference(self):
         attr = AttrFactory.create(
             types=AttrTypeFactory.list(1, qname="b", forward=True)
@@ -618,8 +706,7 @@ class FiltersTests(FactoryTestCase):
             self.filters.field_type(self.obj_nested_nested, attr),
         )
 
-        self.filters.postponed_annotations = True
-        self.filters.union_type = True
+        self.configure(postponed_annotations=True, union_type=True)
         self.assertEqual(
             "None | A.B", self.filters.field_type(self.obj_nested_nested, attr)
         )
@@ -634,13 +721,13 @@ class FiltersTests(FactoryTestCase):
             self.filters.field_type(self.obj, attr),
         )
 
-        self.filters.format.frozen = True
+        self.configure(frozen=True)
         self.assertEqual('Tuple["A.B.C", ...]', self.filters.field_type(self.obj, attr))
 
-        self.filters.subscriptable_types = True
+        self.configure(subscriptable_types=True)
         self.assertEqual('tuple["A.B.C", ...]', self.filters.field_type(self.obj, attr))
 
-        self.filters.format.frozen = False
+        self.configure(frozen=False)
         self.assertEqual('list["A.B.C"]', self.filters.field_type(self.obj, attr))
 
     def test_field_type_with_token_attr(self):
@@ -654,7 +741,7 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual("List[List[FooBar]]", self.filters.field_type(self.obj, attr))
 
         attr.restrictions.max_occurs = 1
-        self.filters.format.frozen = True
+        self.configure(frozen=True)
         self.assertEqual("Tuple[FooBar, ...]", self.filters.field_type(self.obj, attr))
 
         attr.restrictions.max_occurs = 2
@@ -662,7 +749,7 @@ class FiltersTests(FactoryTestCase):
             "Tuple[Tuple[FooBar, ...], ...]", self.filters.field_type(self.obj, attr)
         )
 
-        self.filters.subscriptable_types = True
+        self.configure(subscriptable_types=True)
         self.assertEqual(
             "tuple[tuple[FooBar, ...], ...]", self.filters.field_type(self.obj, attr)
         )
@@ -691,12 +778,12 @@ class FiltersTests(FactoryTestCase):
             self.filters.field_type(self.obj_nested_nested_nested, attr),
         )
 
-        self.filters.union_type = True
+        self.configure(union_type=True)
         self.assertEqual(
             'List["A.B.BossLife" | int]',
             self.filters.field_type(self.obj_nested_nested_nested, attr),
         )
-        self.filters.subscriptable_types = True
+        self.configure(subscriptable_types=True)
         self.assertEqual(
             'list["A.B.BossLife" | int]',
             self.filters.field_type(self.obj_nested_nested_nested, attr),
@@ -707,7 +794,7 @@ class FiltersTests(FactoryTestCase):
 
         self.assertEqual("Dict[str, str]", self.filters.field_type(self.obj, attr))
 
-        self.filters.subscriptable_types = True
+        self.configure(subscriptable_types=True)
         self.assertEqual("dict[str, str]", self.filters.field_type(self.obj, attr))
 
     def test_field_type_with_native_type(self):
@@ -722,7 +809,7 @@ class FiltersTests(FactoryTestCase):
             "Optional[Union[int, str]]", self.filters.field_type(self.obj, attr)
         )
 
-        self.filters.union_type = True
+        self.configure(union_type=True)
         self.assertEqual("None | int | str", self.filters.field_type(self.obj, attr))
 
     def test_field_type_with_prohibited_attr(self):
@@ -784,7 +871,7 @@ class FiltersTests(FactoryTestCase):
         actual = self.filters.choice_type(self.obj_nested_nested_nested, choice)
         self.assertEqual('ForwardRef("C")', actual)
 
-        self.filters.postponed_annotations = True
+        self.configure(postponed_annotations=True)
         actual = self.filters.choice_type(self.obj_nested_nested_nested, choice)
         self.assertEqual('ForwardRef("C")', actual)
 
@@ -794,7 +881,7 @@ class FiltersTests(FactoryTestCase):
         actual = self.filters.choice_type(target, choice)
         self.assertEqual("Type[Union[str, bool]]", actual)
 
-        self.filters.union_type = True
+        self.configure(union_type=True)
         actual = self.filters.choice_type(target, choice)
         self.assertEqual("Type[str | bool]", actual)
 
@@ -812,12 +899,11 @@ class FiltersTests(FactoryTestCase):
         actual = self.filters.choice_type(target, choice)
         self.assertEqual("Type[List[Union[str, bool]]]", actual)
 
-        self.filters.format.frozen = True
+        self.configure(frozen=True)
         actual = self.filters.choice_type(target, choice)
         self.assertEqual("Type[Tuple[Union[str, bool], ...]]", actual)
 
-        self.filters.union_type = True
-        self.filters.subscriptable_types = True
+        self.configure(union_type=True, subscriptable_types=True)
         actual = self.filters.choice_type(target, choice)
         self.assertEqual("Type[tuple[str | bool, ...]]", actual)
 
@@ -924,6 +1010,24 @@ class FiltersTests(FactoryTestCase):
         expected = "import attrs"
         self.assertEqual(expected, self.filters.default_imports(output))
 
+    def test_default_imports_with_overlapping_searches(self):
+        output = "(FooBar"
+
+        self.filters.import_patterns["a"] = {"Foo": ["(Foo"]}
+        self.filters.import_patterns["b"] = {"FooBar": ["(FooBar"]}
+
+        expected = "from a import Foo\nfrom b import FooBar"
+        self.assertEqual(expected, self.filters.default_imports(output))
+
+    def test_search_imports(self):
+        searches = ["[Foo]", " Foo,"]
+        self.assertTrue(self.filters.search_imports("a: List[Foo]", "Foo", searches))
+        self.assertFalse(self.filters.search_imports("a: Foo", "Foo", searches))
+        self.assertFalse(self.filters.search_imports("a: Bar", "Foo", searches))
+
+        searches = ["@attrs.s"]
+        self.assertTrue(self.filters.search_imports("@attrs.s", "__module__", searches))
+
     def test_default_imports_with_annotations(self):
         self.filters.postponed_annotations = True
 
@@ -973,6 +1077,39 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual(expected, self.filters.format_metadata(data))
         self.assertEqual('""', self.filters.format_metadata(""))
 
+    def test_format_dict(self):
+        data = {"a": 1, "b": ["c"]}
+        expected = (
+            '{\n        "a": 1,\n        "b": [\n            "c",\n        ],\n    }'
+        )
+        self.assertEqual(expected, self.filters.format_dict(data, 4))
+        self.assertEqual("{\n    }", self.filters.format_dict({}, 4))
+
+    def test_format_iterable(self):
+        expected = '(\n        "a",\n        1,\n    )'
+        self.assertEqual(expected, self.filters.format_iterable(("a", 1), 4))
+        self.assertEqual("[\n]", self.filters.format_iterable([], 0))
+
+    def test_format_string_is_cached(self):
+        self.assertEqual('"foo"', self.filters.format_string("foo", 4, "name", 4))
+
+        expected = {("foo", 4, "name", 4): '"foo"'}
+        self.assertEqual(expected, self.filters.formatted_strings)
+
+        self.filters.formatted_strings[("foo", 4, "name", 4)] = "bar"
+        self.assertEqual("bar", self.filters.format_string("foo", 4, "name", 4))
+
+    def test_docstring_formatter(self):
+        formatter = self.filters.docstring_formatter(1)
+        self.assertIs(formatter, self.filters.docstring_formatter(1))
+        self.assertIsNot(formatter, self.filters.docstring_formatter(2))
+
+    def test_text_wrapper(self):
+        wrapper = self.filters.text_wrapper(20, True, True, False)
+        self.assertEqual(20, wrapper.width)
+        self.assertIs(wrapper, self.filters.text_wrapper(20, True, True, False))
+        self.assertIsNot(wrapper, self.filters.text_wrapper(20, False, False, True))
+
     def test_import_module(self):
         case = namedtuple("Case", ["module", "from_module", "result"])
         cases = [
@@ -993,6 +1130,12 @@ class FiltersTests(FactoryTestCase):
         for case in cases:
             self.assertEqual(case.result, transform(case.module, case.from_module))
 
+    def test_build_type_patterns(self):
+        actual = Filters.build_type_patterns("Foo")
+        self.assertEqual(8, len(actual))
+        self.assertIn("[Foo]", actual)
+        self.assertIs(actual, Filters.build_type_patterns("Foo"))
+
     def test_build_class_annotation(self):
         config = GeneratorConfig()
         format = config.output.format
@@ -1058,10 +1201,8 @@ class FiltersTests(FactoryTestCase):
         self.assertEqual("c_ab", filters.module_name("cAB"))
 
         expected_substitutions = {
-            ObjectType.CLASS: {},
-            ObjectType.FIELD: {"k": "l"},
-            ObjectType.MODULE: {},
-            ObjectType.PACKAGE: {"m": "n"},
+            ObjectType.FIELD: [(re.compile("k"), "l")],
+            ObjectType.PACKAGE: [(re.compile("m"), "n")],
         }
         self.assertEqual(expected_substitutions, filters.substitutions)
 
@@ -1078,3 +1219,5 @@ class FiltersTests(FactoryTestCase):
             "e": {"(e", " e)"},
         }
         self.assertEqual(expected_imports, filters.import_patterns["a"])
+        self.assertIs(dict, type(filters.import_patterns))
+        self.assertIs(dict, type(filters.import_patterns["a"]))
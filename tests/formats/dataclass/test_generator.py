@@ -3,6 +3,8 @@ import tempfile
 from pathlib import Path
 from unittest import mock
 
+from jinja2 import FileSystemBytecodeCache
+
 from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.resolver import DependenciesResolver
 from xsdata.formats.dataclass.generator import DataclassGenerator
@@ -17,6 +19,19 @@ class DataclassGeneratorTests(FactoryTestCase):
         config = GeneratorConfig()
         self.generator = DataclassGenerator(config)
 
+    def test_init_bytecode_cache(self):
+        cache = DataclassGenerator.init_bytecode_cache()
+        self.assertIsInstance(cache, FileSystemBytecodeCache)
+        self.assertEqual("__xsdata_%s.cache", cache.pattern)
+        self.assertIsInstance(
+            self.generator.env.bytecode_cache, FileSystemBytecodeCache
+        )
+
+        with mock.patch.object(
+            FileSystemBytecodeCache, "__init__", side_effect=RuntimeError
+        ):
+            self.assertIsNone(DataclassGenerator.init_bytecode_cache())
+
     @mock.patch.object(DataclassGenerator, "ruff_code")
     @mock.patch.object(DataclassGenerator, "validate_imports")
     @mock.patch.object(DataclassGenerator, "render_package")
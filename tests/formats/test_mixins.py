@@ -29,7 +29,7 @@ class AbstractGeneratorTests(FactoryTestCase):
 
     @mock.patch.object(NoneGenerator, "module_name", return_value="mod")
     @mock.patch.object(NoneGenerator, "package_name", return_value="pck")
-    def test_normalize_packages(self, *args):
+    def test_normalize_packages(self, mock_package_name, mock_module_name):
         classes = [
             ClassFactory.create(qname="{a}a", package="bar", module="mod"),
             ClassFactory.create(qname="{a}b", package="bar", module="mod"),
@@ -45,6 +45,9 @@ class AbstractGeneratorTests(FactoryTestCase):
         self.assertEqual("mod", classes[1].module)
         self.assertEqual("mod", classes[2].module)
 
+        mock_module_name.assert_called_once_with("mod")
+        mock_package_name.assert_called_once_with("bar")
+
         with self.assertRaises(CodegenError):
             self.generator.normalize_packages(ClassFactory.list(1))
 
@@ -52,6 +55,8 @@ class AbstractGeneratorTests(FactoryTestCase):
     def test_render_header(self, mock_datetime):
         actual = self.generator.render_header()
         self.assertEqual("", actual)
+        mock_datetime.now.assert_not_called()
+
         mock_datetime.now.return_value = datetime.datetime(
             year=2023, month=2, day=22, hour=10, minute=20, second=25
         )
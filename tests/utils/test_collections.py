@@ -10,6 +10,14 @@ class CollectionsTests(TestCase):
         self.assertEqual(-1, collections.find([0, 1], 2))
         self.assertEqual(1, collections.find([0, 1], 1))
 
+    def test_unique_sequence(self):
+        self.assertEqual([2, 1, 3], collections.unique_sequence([2, 1, 2, 3, 1]))
+
+        Item = namedtuple("Item", "a b")
+        items = [Item(1, 2), Item(2, 2), Item(1, 3)]
+        expected = [Item(1, 2), Item(2, 2)]
+        self.assertEqual(expected, collections.unique_sequence(items, key="a"))
+
     def test_prepend(self):
         target = [1, 2, 3]
         prepend_values = [4, 5, 6]
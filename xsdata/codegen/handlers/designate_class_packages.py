@@ -154,7 +154,7 @@ class DesignateClassPackages(ContainerHandlerInterface):
         Returns:
             A list of sets of qualified class names.
         """
-        edges = {obj.qname: list(set(obj.dependencies(True))) for obj in self.container}
+        edges = {obj.qname: list(obj.dependencies(True)) for obj in self.container}
         return strongly_connected_components(edges)
 
     @classmethod
@@ -31,11 +31,16 @@ GLOBAL_TYPES = (
 
 T = TypeVar("T", bound="CodegenModel")
 
+# Slotted models cut the memory footprint of large schemas, python>=3.10 only
+slots: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class CodegenModel:
     """Base codegen model."""
 
+    __slots__ = ()
+
     def clone(self: T, **kwargs: Any) -> T:
         """Return a deep cloned instance."""
         clone = copy.deepcopy(self)
@@ -237,6 +242,10 @@ class AttrType(CodegenModel):
     circular: bool = field(default=False)
     substituted: bool = field(default=False, compare=False)
 
+    def __post_init__(self):
+        """Post init processing."""
+        self.qname = sys.intern(self.qname)
+
     @property
     def datatype(self) -> Optional[DataType]:
         """Return the datatype instance if native, none otherwise."""
@@ -264,7 +273,7 @@ class AttrType(CodegenModel):
         )
 
 
-@dataclass
+@dataclass(**slots)
 class Attr(CodegenModel):
     """Class field model representation.
 
@@ -486,7 +495,7 @@ class Status(IntEnum):
     FINALIZED = 61
 
 
-@dataclass
+@dataclass(**slots)
 class Class(CodegenModel):
     """Class model representation.
 
@@ -538,6 +547,10 @@ class Class(CodegenModel):
     ns_map: Dict = field(default_factory=dict)
     parent: Optional["Class"] = field(default=None, compare=False)
 
+    def __post_init__(self):
+        """Post init processing."""
+        self.qname = sys.intern(self.qname)
+
     @property
     def name(self) -> str:
         """Shortcut for the class local name."""
@@ -654,8 +667,10 @@ class Class(CodegenModel):
         Args:
             allow_circular: Allow circular references
         """
-        for tp in set(self.types()):
-            if tp.is_dependency(allow_circular=allow_circular):
+        seen = set()
+        for tp in self.types():
+            if tp.qname not in seen and tp.is_dependency(allow_circular):
+                seen.add(tp.qname)
                 yield tp.qname
 
     def types(self) -> Iterator[AttrType]:
@@ -665,19 +680,21 @@ class Class(CodegenModel):
 
     def types_with_parents(self) -> Iterator[Tuple[CodegenModel, AttrType]]:
         """Yields all class types with their parent codegen instance."""
-        for ext in self.extensions:
-            yield ext, ext.type
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            for ext in obj.extensions:
+                yield ext, ext.type
 
-        for attr in self.attrs:
-            for tp in attr.types:
-                yield attr, tp
+            for attr in obj.attrs:
+                for tp in attr.types:
+                    yield attr, tp
 
-            for choice in attr.choices:
-                for tp in choice.types:
-                    yield choice, tp
+                for choice in attr.choices:
+                    for tp in choice.types:
+                        yield choice, tp
 
-        for inner in self.inner:
-            yield from inner.types_with_parents()
+            stack.extend(reversed(obj.inner))
 
     def children(self) -> Iterator[CodegenModel]:
         """Yield all codegen children."""
@@ -725,7 +742,7 @@ class Class(CodegenModel):
         return list(reversed(result))
 
 
-@dataclass
+@dataclass(**slots)
 class Import:
     """Python import statement model representation.
 
@@ -1,11 +1,12 @@
 import logging
 import re
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, List, Set
 
-from toposort import toposort_flatten
+from toposort import CircularDependencyError
 
 from xsdata.codegen.exceptions import CodegenError
-from xsdata.codegen.models import Class, Import, get_slug
+from xsdata.codegen.models import Class, Import, get_name, get_slug
 from xsdata.utils import collections
 
 logger = logging.getLogger(__name__)
@@ -45,15 +46,15 @@ class DependenciesResolver:
         Args:
             classes: A list of classes that belong to the same target module
         """
-        self.imports.clear()
-        self.aliases.clear()
+        self.imports = []
+        self.aliases = {}
         self.class_map = self.create_class_map(classes)
         self.class_list = self.create_class_list(classes)
         self.resolve_imports()
 
     def sorted_imports(self) -> List[Import]:
         """Return a new sorted by name list of import instances."""
-        return sorted(self.imports, key=lambda x: x.name)
+        return sorted(self.imports, key=get_name)
 
     def sorted_classes(self) -> List[Class]:
         """Apply aliases and return the sorted the generated class list."""
@@ -74,18 +75,22 @@ class DependenciesResolver:
         Args:
             target: The target class instance to process
         """
-        for attr in target.attrs:
-            for attr_type in attr.types:
-                attr_type.alias = self.aliases.get(attr_type.qname)
+        aliases = self.aliases
+        stack = [target]
+        while stack:
+            obj = stack.pop()
+            for attr in obj.attrs:
+                for attr_type in attr.types:
+                    attr_type.alias = aliases.get(attr_type.qname)
 
-            for choice in attr.choices:
-                for choice_type in choice.types:
-                    choice_type.alias = self.aliases.get(choice_type.qname)
+                for choice in attr.choices:
+                    for choice_type in choice.types:
+                        choice_type.alias = aliases.get(choice_type.qname)
 
-        for ext in target.extensions:
-            ext.type.alias = self.aliases.get(ext.type.qname)
+            for ext in obj.extensions:
+                ext.type.alias = aliases.get(ext.type.qname)
 
-        collections.apply(target.inner, self.apply_aliases)
+            stack.extend(obj.inner)
 
     def resolve_imports(self):
         """Build the list of class imports and set aliases if necessary."""
@@ -138,18 +143,59 @@ class DependenciesResolver:
         Raises:
             CodeGenerationError: if name doesn't exist.
         """
-        if qname not in self.registry:
+        module = self.registry.get(qname)
+        if module is None:
             raise CodegenError("Failed to resolve dependency", qname=qname)
-        return self.registry[qname]
+        return module
 
     def import_classes(self) -> List[str]:
         """Return a list of class qnames that need to be imported."""
-        return [qname for qname in self.class_list if qname not in self.class_map]
+        class_map = self.class_map
+        return [qname for qname in self.class_list if qname not in class_map]
 
     @staticmethod
     def create_class_list(classes: List[Class]) -> List[str]:
-        """Use topology sort to return a flat list for all the dependencies."""
-        return toposort_flatten({obj.qname: set(obj.dependencies()) for obj in classes})
+        """Use topology sort to return a flat list for all the dependencies.
+
+        Kahn's algorithm, level by level, every level is sorted
+        by name to keep the output deterministic.
+
+        Raises:
+            CircularDependencyError: If the dependencies graph has cycles.
+        """
+        graph: Dict[str, Set[str]] = {}
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for obj in classes:
+            qname = obj.qname
+            deps = set(obj.dependencies())
+            deps.discard(qname)
+            graph[qname] = deps
+            in_degree[qname] = len(deps)
+            for dep in deps:
+                dependents[dep].append(qname)
+                if dep not in in_degree:
+                    in_degree[dep] = 0
+
+        result: List[str] = []
+        level = sorted(name for name, degree in in_degree.items() if degree == 0)
+        while level:
+            result.extend(level)
+            ready = []
+            for name in level:
+                for dependent in dependents.get(name, ()):
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        ready.append(dependent)
+
+            level = sorted(ready)
+
+        if len(result) != len(in_degree):
+            raise CircularDependencyError(
+                {name: deps for name, deps in graph.items() if in_degree[name]}
+            )
+
+        return result
 
     @staticmethod
     def create_class_map(classes: List[Class]) -> Dict[str, Class]:
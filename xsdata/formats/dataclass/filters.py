@@ -1,8 +1,10 @@
+import functools
 import re
 import sys
 import textwrap
 from collections import defaultdict
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -10,14 +12,15 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Type,
 )
 
-from docformatter import configuration, format
 from jinja2 import Environment
 
+from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.models import Attr, AttrType, Class
 from xsdata.codegen.utils import ClassUtils
 from xsdata.formats.converter import converter
@@ -34,12 +37,41 @@ from xsdata.models.enums import Tag
 from xsdata.utils import collections, namespaces, text
 from xsdata.utils.objects import literal_value
 
+if TYPE_CHECKING:
+    from docformatter.format import Formatter
+
+NEGATIVE_NUMBER_REGEX = re.compile(r"^-\d*\.?\d+$")
+SAFE_NAME_MAX_ROUNDS = 10
+
 
 class Filters:
-    """Jinja filters for code generation."""
+    """Jinja filters for code generation.
+
+    The generator options are read once on init, the iterable,
+    optional and union type hint formats are resolved there and the
+    naming and type hint results are cached, so the options must not
+    be changed on the instance afterwards.
+    """
 
     DEFAULT_KEY = "default"
     FACTORY_KEY = "default_factory"
+    # Keyed by the frozen and subscriptable types flags
+    ITERABLE_FORMATS = {
+        (False, False): "List[{}]",
+        (False, True): "list[{}]",
+        (True, False): "Tuple[{}, ...]",
+        (True, True): "tuple[{}, ...]",
+    }
+    TYPE_PATTERN_TEMPLATES = (
+        ": {} =",
+        "[{}]",
+        "[{},",
+        " {},",
+        " {}]",
+        " {}(",
+        " | {}",
+        "{} |",
+    )
 
     __slots__ = (
         "substitutions",
@@ -61,14 +93,30 @@ class Filters:
         "relative_imports",
         "postponed_annotations",
         "format",
+        "iterable_format",
+        "optional_format",
+        "union_format",
+        "union_separator",
+        "dict_type",
         "import_patterns",
         "default_class_annotation",
+        "class_names",
+        "field_names",
+        "constant_names",
+        "docstring_formatters",
+        "substituted_names",
+        "extension_matches",
+        "field_type_names",
+        "text_wrappers",
+        "formatted_strings",
     )
 
     def __init__(self, config: GeneratorConfig):
-        self.substitutions: Dict[ObjectType, Dict[str, str]] = defaultdict(dict)
+        self.substitutions: Dict[ObjectType, List[Tuple[Pattern, str]]] = defaultdict(
+            list
+        )
         for sub in config.substitutions.substitution:
-            self.substitutions[sub.type][sub.search] = sub.replace
+            self.substitutions[sub.type].append((re.compile(sub.search), sub.replace))
 
         self.import_patterns: Dict[str, Dict[str, Set[str]]] = defaultdict(
             lambda: defaultdict(set)
@@ -110,13 +158,42 @@ class Filters:
         self.postponed_annotations: bool = config.output.postponed_annotations
         self.format = config.output.format
 
+        # Type hint formats
+        self.iterable_format = self.ITERABLE_FORMATS[
+            self.format.frozen, self.subscriptable_types
+        ]
+        self.optional_format = "None | {}" if self.union_type else "Optional[{}]"
+        self.union_format = "{}" if self.union_type else "Union[{}]"
+        self.union_separator = " | " if self.union_type else ", "
+        self.dict_type = (
+            "dict[str, str]" if self.subscriptable_types else "Dict[str, str]"
+        )
+
         # Build things
         for module, imports in self.build_import_patterns().items():
             for imp, patterns in imports.items():
                 self.import_patterns[module][imp].update(patterns)
 
+        # Freeze the nested defaultdicts, lookups must not add empty entries
+        self.import_patterns = {
+            module: dict(imports) for module, imports in self.import_patterns.items()
+        }
+
         self.default_class_annotation = self.build_class_annotation(self.format)
 
+        # Caches
+        self.class_names: Dict[str, str] = {}
+        self.field_names: Dict[Tuple[str, str], str] = {}
+        self.constant_names: Dict[Tuple[str, str], str] = {}
+        self.docstring_formatters: Dict[int, "Formatter"] = {}
+        self.substituted_names: Dict[Tuple[ObjectType, str], str] = {}
+        self.extension_matches: Dict[
+            Tuple[ExtensionType, str], List[GeneratorExtension]
+        ] = {}
+        self.field_type_names: Dict[Tuple, str] = {}
+        self.text_wrappers: Dict[Tuple, textwrap.TextWrapper] = {}
+        self.formatted_strings: Dict[Tuple[str, int, str, int], str] = {}
+
     def register(self, env: Environment):
         """Register the template filters to the jinja environment."""
         env.globals.update(
@@ -196,18 +273,22 @@ class Filters:
         Returns:
             The final class name
         """
-        name = self.apply_substitutions(name, ObjectType.CLASS)
-        name = self.safe_name(name, self.class_safe_prefix, self.class_case)
-        return self.apply_substitutions(name, ObjectType.CLASS)
+        result = self.class_names.get(name)
+        if result is None:
+            result = self.apply_substitutions(name, ObjectType.CLASS)
+            result = self.safe_name(result, self.class_safe_prefix, self.class_case)
+            result = self.apply_substitutions(result, ObjectType.CLASS)
+            self.class_names[name] = result
+
+        return result
 
     def class_bases(self, obj: Class, class_name: str) -> List[str]:
         """Return a list of base class names."""
         bases = [self.type_name(x.type) for x in obj.extensions]
 
         derived = len(obj.extensions) > 0
-        for ext in self.extensions[ExtensionType.CLASS]:
-            is_valid = not derived or ext.apply_if_derived
-            if is_valid and ext.pattern.match(class_name):
+        for ext in self.class_extensions(ExtensionType.CLASS, class_name):
+            if not derived or ext.apply_if_derived:
                 if ext.prepend:
                     bases.insert(0, ext.func_name)
                 else:
@@ -222,9 +303,8 @@ class Filters:
             annotations.append(self.default_class_annotation)
 
         derived = len(obj.extensions) > 0
-        for ext in self.extensions[ExtensionType.DECORATOR]:
-            is_valid = not derived or ext.apply_if_derived
-            if is_valid and ext.pattern.match(class_name):
+        for ext in self.class_extensions(ExtensionType.DECORATOR, class_name):
+            if not derived or ext.apply_if_derived:
                 if ext.prepend:
                     annotations.insert(0, f"@{ext.func_name}")
                 else:
@@ -232,12 +312,49 @@ class Filters:
 
         return collections.unique_sequence(annotations)
 
+    def class_extensions(
+        self, ext_type: ExtensionType, class_name: str
+    ) -> List[GeneratorExtension]:
+        """Return the extensions whose pattern matches the class name.
+
+        The matches are cached per extension type and class name, as
+        the same class names repeat across modules and inner classes.
+
+        Args:
+            ext_type: The extension type
+            class_name: The final class name
+
+        Returns:
+            The list of the matching extensions.
+        """
+        extensions = self.extensions.get(ext_type)
+        if not extensions:
+            return []
+
+        key = (ext_type, class_name)
+        result = self.extension_matches.get(key)
+        if result is None:
+            result = [ext for ext in extensions if ext.pattern.match(class_name)]
+            self.extension_matches[key] = result
+
+        return result
+
     def apply_substitutions(self, name: str, obj_type: ObjectType) -> str:
         """Apply name substitutions by obj type."""
-        for search, replace in self.substitutions[obj_type].items():
-            name = re.sub(search, replace, name)
+        substitutions = self.substitutions.get(obj_type)
+        if not substitutions:
+            return name
 
-        return name
+        key = (obj_type, name)
+        result = self.substituted_names.get(key)
+        if result is None:
+            result = name
+            for pattern, replace in substitutions:
+                result = pattern.sub(replace, result)
+
+            self.substituted_names[key] = result
+
+        return result
 
     def field_definition(
         self,
@@ -278,10 +395,18 @@ class Filters:
         Returns:
             The final field name
         """
-        prefix = self.field_safe_prefix
-        name = self.apply_substitutions(name, ObjectType.FIELD)
-        name = self.safe_name(name, prefix, self.field_case, class_name=class_name)
-        return self.apply_substitutions(name, ObjectType.FIELD)
+        key = (name, class_name)
+        result = self.field_names.get(key)
+        if result is None:
+            prefix = self.field_safe_prefix
+            result = self.apply_substitutions(name, ObjectType.FIELD)
+            result = self.safe_name(
+                result, prefix, self.field_case, class_name=class_name
+            )
+            result = self.apply_substitutions(result, ObjectType.FIELD)
+            self.field_names[key] = result
+
+        return result
 
     def constant_name(self, name: str, class_name: str) -> str:
         """Constant name filter.
@@ -298,10 +423,18 @@ class Filters:
         Returns:
             The final constant name
         """
-        prefix = self.field_safe_prefix
-        name = self.apply_substitutions(name, ObjectType.FIELD)
-        name = self.safe_name(name, prefix, self.constant_case, class_name=class_name)
-        return self.apply_substitutions(name, ObjectType.FIELD)
+        key = (name, class_name)
+        result = self.constant_names.get(key)
+        if result is None:
+            prefix = self.field_safe_prefix
+            result = self.apply_substitutions(name, ObjectType.FIELD)
+            result = self.safe_name(
+                result, prefix, self.constant_case, class_name=class_name
+            )
+            result = self.apply_substitutions(result, ObjectType.FIELD)
+            self.constant_names[key] = result
+
+        return result
 
     def module_name(self, name: str) -> str:
         """Module name filter.
@@ -372,22 +505,36 @@ class Filters:
         name_case: Callable,
         **kwargs: Any,
     ) -> str:
-        """Sanitize names for safe generation."""
-        if not name:
-            return self.safe_name(prefix, prefix, name_case, **kwargs)
+        """Sanitize names for safe generation.
 
-        if re.match(r"^-\d*\.?\d+$", name):
-            return self.safe_name(f"{prefix}_minus_{name}", prefix, name_case, **kwargs)
+        A valid prefix needs at most a few rounds, e.g. an empty name
+        becomes the prefix, which might be reserved and gets suffixed.
 
-        slug = text.alnum(name)
-        if not slug or not slug[0].isalpha():
-            return self.safe_name(f"{prefix}_{name}", prefix, name_case, **kwargs)
+        Raises:
+            CodegenError: If the prefix can't produce a valid name.
+        """
+        original = name
+        for _ in range(SAFE_NAME_MAX_ROUNDS):
+            if not name:
+                name = prefix
+            elif NEGATIVE_NUMBER_REGEX.match(name):
+                name = f"{prefix}_minus_{name}"
+            else:
+                slug = text.alnum(name)
+                if not slug or not slug[0].isalpha():
+                    name = f"{prefix}_{name}"
+                else:
+                    result = name_case(name, **kwargs)
+                    if not text.is_reserved(result):
+                        return result
 
-        result = name_case(name, **kwargs)
-        if text.is_reserved(result):
-            return self.safe_name(f"{name}_{prefix}", prefix, name_case, **kwargs)
+                    name = f"{name}_{prefix}"
 
-        return result
+        raise CodegenError(
+            "Failed to generate a safe name, check the safe prefix",
+            name=original,
+            prefix=prefix,
+        )
 
     def import_module(self, module: str, from_module: str) -> str:
         """Convert import module to relative path if config is enabled."""
@@ -496,65 +643,121 @@ class Filters:
 
     @classmethod
     def filter_metadata(cls, data: Dict) -> Dict:
-        """Filter out false,none keys from the given dict."""
-        return {
-            key: value
-            for key, value in data.items()
-            if value is not None and value is not False
-        }
+        """Filter out false,none keys from the given dict in place."""
+        for key in [k for k, v in data.items() if v is None or v is False]:
+            del data[key]
+
+        return data
 
     def format_arguments(self, data: Dict, indent: int = 0) -> str:
         """Return a pretty keyword arguments representation."""
+        if not data:
+            return ""
+
         ind = " " * indent
-        fmt = "    {}{}={}"
-        lines = [
-            fmt.format(ind, key, self.format_metadata(value, indent + 4, key))
-            for key, value in data.items()
-        ]
+        next_indent = indent + 4
+        buffer: List[str] = []
+        sep = "\n"
+        for key, value in data.items():
+            buffer.append(f"{sep}{ind}    {key}=")
+            self.write_metadata(buffer, value, next_indent, key)
+            sep = ",\n"
 
-        return "\n{}\n{}".format(",\n".join(lines), ind) if lines else ""
+        buffer.append(f"\n{ind}")
+        return "".join(buffer)
 
     def format_metadata(self, data: Any, indent: int = 0, key: str = "") -> str:
         """Prettify field metadata for code generation."""
-        if isinstance(data, dict):
-            return self.format_dict(data, indent)
+        buffer: List[str] = []
+        self.write_metadata(buffer, data, indent, key)
+        return "".join(buffer)
+
+    def format_dict(self, data: Dict, indent: int) -> str:
+        """Return a pretty string representation of a dict."""
+        buffer: List[str] = []
+        self.write_dict(buffer, data, indent)
+        return "".join(buffer)
 
-        if collections.is_array(data):
-            return self.format_iterable(data, indent)
+    def format_iterable(self, data: Iterable, indent: int) -> str:
+        """Return a pretty string representation of an iterable."""
+        buffer: List[str] = []
+        self.write_iterable(buffer, data, indent)
+        return "".join(buffer)
 
-        if isinstance(data, str):
-            return self.format_string(data, indent, key, 4)
+    def write_metadata(
+        self, buffer: List[str], data: Any, indent: int, key: str = ""
+    ) -> None:
+        """Append the pretty field metadata parts to the buffer.
 
-        return literal_value(data)
+        The nested containers are written into the same buffer, which
+        is joined once, instead of joining every nesting level.
 
-    def format_dict(self, data: Dict, indent: int) -> str:
-        """Return a pretty string representation of a dict."""
+        Args:
+            buffer: The list of string parts
+            data: The metadata value
+            indent: The current indentation level
+            key: The metadata key of the value
+        """
+        # Fast path for the exact builtin types, subclasses fall through
+        data_type = type(data)
+        if data_type is str:
+            buffer.append(self.format_string(data, indent, key, 4))
+        elif data_type is dict:
+            self.write_dict(buffer, data, indent)
+        elif data_type is tuple or data_type is list:
+            self.write_iterable(buffer, data, indent)
+        elif isinstance(data, dict):
+            self.write_dict(buffer, data, indent)
+        elif collections.is_array(data):
+            self.write_iterable(buffer, data, indent)
+        elif isinstance(data, str):
+            buffer.append(self.format_string(data, indent, key, 4))
+        else:
+            buffer.append(literal_value(data))
+
+    def write_dict(self, buffer: List[str], data: Dict, indent: int) -> None:
+        """Append the pretty dict parts to the buffer."""
         ind = " " * indent
-        fmt = '    {}"{}": {},'
-        lines = [
-            fmt.format(ind, key, self.format_metadata(value, indent + 4, key))
-            for key, value in data.items()
-        ]
+        next_indent = indent + 4
+        buffer.append("{")
+        for key, value in data.items():
+            buffer.append(f'\n{ind}    "{key}": ')
+            self.write_metadata(buffer, value, next_indent, key)
+            buffer.append(",")
 
-        return "{{\n{}\n{}}}".format("\n".join(lines), ind)
+        buffer.append(f"\n{ind}}}")
 
-    def format_iterable(self, data: Iterable, indent: int) -> str:
-        """Return a pretty string representation of an iterable."""
+    def write_iterable(self, buffer: List[str], data: Iterable, indent: int) -> None:
+        """Append the pretty iterable parts to the buffer."""
         ind = " " * indent
-        fmt = "    {}{},"
-        lines = [
-            fmt.format(ind, self.format_metadata(value, indent + 4)) for value in data
-        ]
-        wrap = "(\n{}\n{})" if isinstance(data, tuple) else "[\n{}\n{}]"
-        return wrap.format("\n".join(lines), ind)
+        next_indent = indent + 4
+        is_tuple = isinstance(data, tuple)
+        buffer.append("(" if is_tuple else "[")
+        for value in data:
+            buffer.append(f"\n{ind}    ")
+            self.write_metadata(buffer, value, next_indent)
+            buffer.append(",")
+
+        buffer.append(f"\n{ind})" if is_tuple else f"\n{ind}]")
 
     def format_string(self, data: str, indent: int, key: str = "", pad: int = 0) -> str:
         """Return a pretty string representation of a string.
 
         If the total length of the input string plus indent plus the key
         length and the additional pad is more than the max line length,
-        wrap the text into multiple lines, avoiding breaking long words
+        wrap the text into multiple lines, avoiding breaking long words.
+
+        The results are cached, the same values repeat across fields.
         """
+        cache_key = (data, indent, key, pad)
+        result = self.formatted_strings.get(cache_key)
+        if result is None:
+            result = self._format_string(data, indent, key, pad)
+            self.formatted_strings[cache_key] = result
+
+        return result
+
+    def _format_string(self, data: str, indent: int, key: str, pad: int) -> str:
         if data.startswith("ForwardRef("):
             return data
 
@@ -582,15 +785,14 @@ class Filters:
             return f'"{value}"'
 
         next_indent = indent + 4
+        wrapper = self.text_wrapper(
+            width=self.max_line_length - next_indent - 2,  # plus quotes
+            drop_whitespace=False,
+            replace_whitespace=False,
+            break_long_words=True,
+        )
         value = "\n".join(
-            f'{" " * next_indent}"{line}"'
-            for line in textwrap.wrap(
-                value,
-                width=self.max_line_length - next_indent - 2,  # plus quotes
-                drop_whitespace=False,
-                replace_whitespace=False,
-                break_long_words=True,
-            )
+            f'{" " * next_indent}"{line}"' for line in wrapper.wrap(value)
         )
         return f"(\n{value}\n{' ' * indent})"
 
@@ -598,16 +800,54 @@ class Filters:
         self, string: str, offset: int = 0, subsequent_indent: str = "    "
     ) -> str:
         """Wrap text in respect to the max line length and the given offset."""
-        return "\n".join(
-            textwrap.wrap(
-                string,
-                width=self.max_line_length - offset,
-                drop_whitespace=True,
-                replace_whitespace=True,
-                break_long_words=False,
+        wrapper = self.text_wrapper(
+            width=self.max_line_length - offset,
+            drop_whitespace=True,
+            replace_whitespace=True,
+            break_long_words=False,
+            subsequent_indent=subsequent_indent,
+        )
+        return "\n".join(wrapper.wrap(string))
+
+    def text_wrapper(
+        self,
+        width: int,
+        drop_whitespace: bool,
+        replace_whitespace: bool,
+        break_long_words: bool,
+        subsequent_indent: str = "",
+    ) -> textwrap.TextWrapper:
+        """Return a cached text wrapper instance for the given options.
+
+        Args:
+            width: The maximum length of the wrapped lines
+            drop_whitespace: Drop whitespace at the beginning and end of lines
+            replace_whitespace: Replace whitespace characters with spaces
+            break_long_words: Break words longer than the width
+            subsequent_indent: The prefix of all lines except the first
+
+        Returns:
+            The text wrapper instance.
+        """
+        key = (
+            width,
+            drop_whitespace,
+            replace_whitespace,
+            break_long_words,
+            subsequent_indent,
+        )
+        wrapper = self.text_wrappers.get(key)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(
+                width=width,
+                drop_whitespace=drop_whitespace,
+                replace_whitespace=replace_whitespace,
+                break_long_words=break_long_words,
                 subsequent_indent=subsequent_indent,
             )
-        )
+            self.text_wrappers[key] = wrapper
+
+        return wrapper
 
     @classmethod
     def clean_docstring(cls, string: Optional[str], escape: bool = True) -> str:
@@ -650,23 +890,7 @@ class Filters:
 
         content += ' """' if content.endswith('"') else '"""'
 
-        max_length = self.max_line_length - level * 4
-        configurator = configuration.Configurater(
-            [
-                "--wrap-summaries",
-                str(max_length - 3),
-                "--wrap-descriptions",
-                str(max_length - 7),
-                "--make-summary-multi-line",
-            ]
-        )
-        configurator.do_parse_arguments()
-        formatter = format.Formatter(
-            configurator.args,
-            sys.stderr,
-            sys.stdin,
-            sys.stdout,
-        )
+        formatter = self.docstring_formatter(level)
         content = formatter._do_format_code(content)
 
         if params:
@@ -677,6 +901,45 @@ class Filters:
 
         return content
 
+    def docstring_formatter(self, level: int) -> "Formatter":
+        """Return the docformatter instance for the given indentation level.
+
+        The formatters are cached, parsing the docformatter arguments
+        is expensive and the wrap lengths only depend on the level.
+        Docformatter is imported on first use, to keep it off the
+        import time of the filters module.
+
+        Args:
+            level: The indentation level of the docstring
+
+        Returns:
+            The formatter instance.
+        """
+        formatter = self.docstring_formatters.get(level)
+        if formatter is None:
+            from docformatter import configuration, format
+
+            max_length = self.max_line_length - level * 4
+            configurator = configuration.Configurater(
+                [
+                    "--wrap-summaries",
+                    str(max_length - 3),
+                    "--wrap-descriptions",
+                    str(max_length - 7),
+                    "--make-summary-multi-line",
+                ]
+            )
+            configurator.do_parse_arguments()
+            formatter = format.Formatter(
+                configurator.args,
+                sys.stderr,
+                sys.stdin,
+                sys.stdout,
+            )
+            self.docstring_formatters[level] = formatter
+
+        return formatter
+
     def field_default_value(self, attr: Attr, ns_map: Optional[Dict] = None) -> Any:
         """Generate the field default value/factory for the given attribute."""
         if attr.is_list or (attr.is_tokens and not attr.default):
@@ -695,6 +958,9 @@ class Filters:
         if attr.is_tokens:
             return self.field_default_tokens(attr, types, ns_map)
 
+        if types == [str]:
+            return literal_value(attr.default)
+
         return literal_value(
             converter.deserialize(
                 attr.default, types, ns_map=ns_map, format=attr.restrictions.format
@@ -747,23 +1013,21 @@ class Filters:
 
         result = self._field_type_names(obj, attr, choice=False)
 
-        iterable_fmt = self._get_iterable_format()
-        if attr.is_tokens:
-            result = iterable_fmt.format(result)
+        is_tokens = attr.is_tokens
+        is_list = attr.is_list
+        if is_tokens or is_list:
+            if is_tokens:
+                result = self.iterable_format.format(result)
 
-        if attr.is_list:
-            return iterable_fmt.format(result)
-
-        if attr.is_tokens:
-            return result
+            return self.iterable_format.format(result) if is_list else result
 
         if attr.is_dict:
-            return "dict[str, str]" if self.subscriptable_types else "Dict[str, str]"
+            return self.dict_type
 
         if attr.is_nillable or (
             attr.default is None and (attr.is_optional or not self.format.kw_only)
         ):
-            return f"None | {result}" if self.union_type else f"Optional[{result}]"
+            return self.optional_format.format(result)
 
         return result
 
@@ -778,20 +1042,19 @@ class Filters:
             The string representation of the type hint.
         """
         results = []
-        iterable_fmt = self._get_iterable_format()
         for choice in attr.choices:
             names = self._field_type_names(obj, choice, choice=False)
             if choice.is_tokens:
-                names = iterable_fmt.format(names)
+                names = self.iterable_format.format(names)
             results.append(names)
 
         result = self._join_type_names(results)
 
         if attr.is_list:
-            return iterable_fmt.format(result)
+            return self.iterable_format.format(result)
 
         if attr.is_optional or not self.format.kw_only:
-            return f"None | {result}" if self.union_type else f"Optional[{result}]"
+            return self.optional_format.format(result)
 
         return result
 
@@ -815,8 +1078,7 @@ class Filters:
         result = self._field_type_names(obj, choice, choice=True)
 
         if choice.is_tokens:
-            iterable_fmt = self._get_iterable_format()
-            result = iterable_fmt.format(result)
+            result = self.iterable_format.format(result)
 
         if result.startswith('"'):
             return f"ForwardRef({result})"
@@ -837,24 +1099,39 @@ class Filters:
         if len(type_names) == 1:
             return type_names[0]
 
-        if self.union_type:
-            return " | ".join(type_names)
-
-        return f'Union[{", ".join(type_names)}]'
+        return self.union_format.format(self.union_separator.join(type_names))
 
     def _field_type_name(
         self, obj: Class, attr_type: AttrType, choice: bool = False
     ) -> str:
-        name = self.type_name(attr_type)
         if attr_type.forward:
+            name = self.type_name(attr_type)
             inner = ClassUtils.find_nested(obj, attr_type.qname)
             outer_str = ".".join(map(self.class_name, inner.parent_names()))
-            name = f'"{outer_str}.{name}"'
-        elif attr_type.circular:
-            name = f'"{name}"'
+            return self._field_type_quote(f'"{outer_str}.{name}"', choice)
+
+        # Forward references depend on the parent class, the rest don't
+        key = (
+            attr_type.qname,
+            attr_type.alias,
+            attr_type.native,
+            attr_type.circular,
+            choice,
+        )
+        result = self.field_type_names.get(key)
+        if result is None:
+            name = self.type_name(attr_type)
+            if attr_type.circular:
+                name = f'"{name}"'
 
+            result = self._field_type_quote(name, choice)
+            self.field_type_names[key] = result
+
+        return result
+
+    def _field_type_quote(self, name: str, choice: bool) -> str:
         if self.postponed_annotations and not choice:
-            name = name.strip('"')
+            return name.strip('"')
 
         return name
 
@@ -876,7 +1153,7 @@ class Filters:
             names = [
                 name
                 for name, searches in types.items()
-                if any(search in output for search in searches)
+                if self.search_imports(output, name, searches)
             ]
 
             if len(names) == 1 and names[0] == "__module__":
@@ -889,9 +1166,26 @@ class Filters:
 
         return "\n".join(collections.unique_sequence(imports))
 
-    def _get_iterable_format(self):
-        fmt = "Tuple[{}, ...]" if self.format.frozen else "List[{}]"
-        return fmt.lower() if self.subscriptable_types else fmt
+    @classmethod
+    def search_imports(cls, output: str, name: str, searches: Iterable[str]) -> bool:
+        """Return whether any of the import searches occurs in the output.
+
+        Most searches embed the imported name, e.g. `[Decimal]`, when
+        the name itself is missing from the output, a single scan rules
+        out all of them.
+
+        Args:
+            output: The generated module output
+            name: The imported name
+            searches: The import search strings
+
+        Returns:
+            The bool result.
+        """
+        if name not in output and all(name in search for search in searches):
+            return False
+
+        return any(search in output for search in searches)
 
     @classmethod
     def build_import_patterns(cls) -> Dict[str, Dict]:
@@ -921,15 +1215,10 @@ class Filters:
         }
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def build_type_patterns(cls, x: str) -> Tuple:
-        """Return all possible type occurrences in the generated code."""
-        return (
-            f": {x} =",
-            f"[{x}]",
-            f"[{x},",
-            f" {x},",
-            f" {x}]",
-            f" {x}(",
-            f" | {x}",
-            f"{x} |",
-        )
+        """Return all possible type occurrences in the generated code.
+
+        The patterns are cached per class and type name.
+        """
+        return tuple(template.format(x) for template in cls.TYPE_PATTERN_TEMPLATES)
@@ -6,7 +6,7 @@ import sys
 from pathlib import Path
 from typing import Iterator, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.models import Class, Import
@@ -40,11 +40,28 @@ class DataclassGenerator(AbstractGenerator):
         super().__init__(config)
         template_paths = self.get_template_paths()
         loader = FileSystemLoader(template_paths)
-        self.env = Environment(loader=loader, autoescape=False)
+        self.env = Environment(
+            loader=loader,
+            autoescape=False,
+            bytecode_cache=self.init_bytecode_cache(),
+        )
         self.filters = self.init_filters(config)
         self.filters.register(self.env)
         self.ruff_config = Path(__file__).parent / "ruff.toml"
 
+    @classmethod
+    def init_bytecode_cache(cls) -> Optional[BytecodeCache]:
+        """Return the cache for the compiled templates.
+
+        The compiled templates are stored in a private temp directory
+        and reused across runs, if no safe directory can be determined
+        the templates are compiled on every run.
+        """
+        try:
+            return FileSystemBytecodeCache(pattern="__xsdata_%s.cache")
+        except (OSError, RuntimeError):
+            return None
+
     @classmethod
     def get_template_paths(cls) -> List[str]:
         """Return a list of template paths to feed the jinja2 loader."""
@@ -146,9 +163,8 @@ class DataclassGenerator(AbstractGenerator):
         Returns:
             The rendered module output.
         """
-        if len({x.target_namespace for x in classes}) == 1:
-            module_namespace = classes[0].target_namespace
-        else:
+        module_namespace = classes[0].target_namespace
+        if any(x.target_namespace != module_namespace for x in classes[1:]):
             module_namespace = None
 
         resolver.process(classes)
@@ -34,6 +34,14 @@ class AbstractGenerator(abc.ABC):
 
     __slots__ = "config"
 
+    HEADER_TEMPLATE = (
+        '"""This file was generated by xsdata, v{version}, on {now}\n'
+        "\n"
+        "Generator: {generator}\n"
+        "See: https://xsdata.readthedocs.io/\n"
+        '"""\n'
+    )
+
     def __init__(self, config: GeneratorConfig):
         self.config = config
 
@@ -65,11 +73,10 @@ class AbstractGenerator(abc.ABC):
             return ""
 
         now = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
-        return (
-            f'"""This file was generated by xsdata, v{__version__}, on {now}'
-            f"\n\nGenerator: {self.__class__.__qualname__}\n"
-            f"See: https://xsdata.readthedocs.io/\n"
-            '"""\n'
+        return self.HEADER_TEMPLATE.format(
+            version=__version__,
+            now=now,
+            generator=self.__class__.__qualname__,
         )
 
     def normalize_packages(self, classes: List[Class]):
@@ -82,19 +89,21 @@ class AbstractGenerator(abc.ABC):
             CodeGenerationError: If the analyzer failed to
                 designate a class to a package and module.
         """
-        modules = {}
-        packages = {}
+        modules: Dict[str, str] = {}
+        packages: Dict[str, str] = {}
         for obj in classes:
             if obj.package is None or obj.module is None:
                 raise CodegenError(
                     f"Class `{obj.name}` has not been assigned to a package"
                 )
 
-            if obj.module not in modules:
-                modules[obj.module] = self.module_name(obj.module)
+            module = modules.get(obj.module)
+            if module is None:
+                module = modules[obj.module] = self.module_name(obj.module)
 
-            if obj.package not in packages:
-                packages[obj.package] = self.package_name(obj.package)
+            package = packages.get(obj.package)
+            if package is None:
+                package = packages[obj.package] = self.package_name(obj.package)
 
-            obj.module = modules[obj.module]
-            obj.package = packages[obj.package]
+            obj.module = module
+            obj.package = package
@@ -34,6 +34,9 @@ def unique_sequence(items: Iterable[T], key: Optional[str] = None) -> List[T]:
     Returns:
         A new unique list.
     """
+    if key is None:
+        return list(dict.fromkeys(items))
+
     seen = set()
 
     def is_new(val: Any) -> bool:
@@ -1,5 +1,4 @@
 import abc
-import copy
 import importlib
 import random
 import unittest
@@ -137,7 +136,7 @@ class ClassFactory(Factory):
             qname = build_qname("xsdata", f"{prefix}{cls.next_letter()}")
 
         if ns_map is None:
-            ns_map = copy.deepcopy(DEFAULT_NS_MAP)
+            ns_map = dict(DEFAULT_NS_MAP)
 
         return Class(
             qname=qname,
@@ -1,3 +1,4 @@
+import functools
 import re
 import string
 from typing import Any, List, Match, Tuple
@@ -215,6 +216,7 @@ def escape_string(value: str) -> str:
 __alnum_ascii__ = set(string.digits + string.ascii_letters)
 
 
+@functools.lru_cache(maxsize=1024)
 def alnum(value: str) -> str:
     """Return the ascii alphanumerical characters in lower case."""
     return "".join(filter(__alnum_ascii__.__contains__, value)).lower()